@@ -4,10 +4,11 @@ from __future__ import annotations
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import DelCoWaterAPI
 from .const import DOMAIN
-from .coordinator import DelCoWaterCoordinator
+from .coordinator import DelCoWaterCoordinator, bill_store
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
@@ -19,8 +20,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     username = entry.data[CONF_USERNAME]
     password = entry.data[CONF_PASSWORD]
 
-    api = DelCoWaterAPI(username, password)
-    coordinator = DelCoWaterCoordinator(hass, api)
+    api = DelCoWaterAPI(async_get_clientsession(hass), username, password)
+    coordinator = DelCoWaterCoordinator(hass, api, entry.entry_id)
 
     # Fetch initial data
     await coordinator.async_config_entry_first_refresh()
@@ -38,3 +39,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the parsed bills stored for a deleted config entry."""
+    await bill_store(hass, entry.entry_id).async_remove()
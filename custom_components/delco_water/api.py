@@ -1,38 +1,211 @@
 """API client for Del-Co Water."""
 from __future__ import annotations
 
+import asyncio
+import base64
 from datetime import datetime, timedelta
 from io import BytesIO
+import json
 import logging
 import re
+import time
 from typing import Any
 
+import aiohttp
+from homeassistant.util.json import json_loads
 import pdfplumber
-import requests
 from pycognito import Cognito
 
 from .const import (
+    ACCOUNT_CACHE_TTL,
     API_BASE_URL,
+    BILLING_CACHE_TTL,
     COGNITO_CLIENT_ID,
     COGNITO_REGION,
     COGNITO_USER_POOL_ID,
     FREQUENCY_DAILY,
+    PAYMENT_CACHE_TTL,
+    STALE_CACHE_MAX_AGE,
+    USAGE_CACHE_TTL,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fail fast when the host can't be reached, but give slow bodies (bill PDFs)
+# time as long as data keeps arriving
+_TIMEOUT = aiohttp.ClientTimeout(total=45, connect=5, sock_read=30)
+
+# Date format expected by the API for startDate/endDate
+_DATE_FORMAT = "%Y-%m-%d"
+
+# Renew the access token this many seconds before it actually expires
+_TOKEN_EXPIRY_MARGIN = 60
+
+# Bill PDF downloads in flight and parses allowed in HA's shared executor at
+# once during a backfill; each bill is parsed as soon as its download finishes
+_MAX_CONCURRENT_PDF_DOWNLOADS = 4
+_MAX_CONCURRENT_PDF_PARSES = 2
+
+# Bill PDF formats (see parse_bill_pdf)
+# FORMAT 1 (NEW) and FORMAT 2 (MID) both start at the "Water ..." charge line,
+# so they are combined into one alternation and matched in a single scan; the
+# named group that participated tells the formats apart
+# FORMAT 1 - NEW (2025-08+): Usage in GALLONS, no hyphen between dates
+# Water Residential Charge ADDR PREMISE MM/DD/YY MM/DD/YY PRIOR CURR USAGE $CHG
+_NEW_CHARGE_LINE = (
+    r"(?P<new>Water Residential Charge\s+.*?"
+    r"(?P<new_from>\d{2}/\d{2}/\d{2})\s+(?P<new_to>\d{2}/\d{2}/\d{2})\s+"
+    r"(?P<new_prior>\d+)\s+(?P<new_current>\d+)\s+(?P<new_usage>\d+)\s+"
+    r"\$?(?P<new_charges>[\d.]+))"
+)
+# FORMAT 2 - MID: Usage in HGAL, hyphen between dates, commas in readings
+# Water (Residential Charge|Charges...) ADDR PREMISE MM/DD/YY - MM/DD/YY ...
+_MID_CHARGE_LINE = (
+    r"(?P<mid>Water (?:Residential Charge|Charges[^\d]*)\s+.*?"
+    r"(?P<mid_from>\d{2}/\d{2}/\d{2})\s*-\s*(?P<mid_to>\d{2}/\d{2}/\d{2})\s+"
+    r"(?P<mid_prior>[\d,]+)\s+(?P<mid_current>[\d,]+)\s+(?P<mid_usage>\d+)\s+"
+    r"\$?(?P<mid_charges>[\d.]+))"
+)
+_CHARGE_LINE_PATTERN = re.compile(f"{_NEW_CHARGE_LINE}|{_MID_CHARGE_LINE}")
+# FORMAT 1 takes priority wherever it appears, so a FORMAT 2 match is
+# re-checked for a later FORMAT 1 line
+_NEW_CHARGE_LINE_PATTERN = re.compile(_NEW_CHARGE_LINE)
+# FORMAT 3 - OLD: Two-line format with meter ID
+# METER_ID MM/DD/YY - MM/DD/YY Actual PRIOR CURRENT USAGE_HGAL
+# Water Residential Service DAYS TOTAL USAGE ALL METERS HGAL GPD $CHARGE
+_OLD_READING_PATTERN = re.compile(
+    r"(\d+)\s+(\d{2}/\d{2}/\d{2})\s*-\s*(\d{2}/\d{2}/\d{2})\s+"
+    r"Actual\s+([\d,]+)\s+([\d,]+)\s+(\d+)"
+)
+_OLD_CHARGE_PATTERN = re.compile(
+    r"Water Residential Service\s+\d+\s+"
+    r"TOTAL USAGE ALL METERS\s+(\d+)\s+[\d.]+\s+\$?([\d.]+)"
+)
+
+
+def _parse_charge_line(text: str) -> dict[str, Any] | None:
+    """Parse FORMAT 1 (new_gallons) and FORMAT 2 (mid_hgal) bill text."""
+    # Cheap substring probes decide whether the regex can match at all; the
+    # pattern starts with literal anchor text, so the search only needs to
+    # cover the text from the first anchor onwards
+    anchors = [
+        pos
+        for pos in (
+            text.find("Water Residential Charge"),
+            text.find("Water Charges"),
+        )
+        if pos >= 0
+    ]
+    if not anchors or not (match := _CHARGE_LINE_PATTERN.search(text, min(anchors))):
+        return None
+    if match["mid"] and (
+        new_match := _NEW_CHARGE_LINE_PATTERN.search(text, match.start())
+    ):
+        match = new_match
+
+    # FORMAT 1 - NEW (2025-08+): Usage in GALLONS
+    if match["new"]:
+        return {
+            "service_from": match["new_from"],
+            "service_to": match["new_to"],
+            "prior_reading": int(match["new_prior"]),
+            "current_reading": int(match["new_current"]),
+            "usage_gallons": int(match["new_usage"]),  # Already in gallons
+            "charges": float(match["new_charges"]),
+            "format": "new_gallons",
+        }
+
+    # FORMAT 2 - MID: Usage in HGAL, hyphen between dates
+    return {
+        "service_from": match["mid_from"],
+        "service_to": match["mid_to"],
+        "prior_reading": int(match["mid_prior"].replace(",", "")),
+        "current_reading": int(match["mid_current"].replace(",", "")),
+        "usage_gallons": int(match["mid_usage"]) * 100,  # HGAL to gallons
+        "charges": float(match["mid_charges"]),
+        "format": "mid_hgal",
+    }
+
+
+def _parse_meter_lines(text: str) -> dict[str, Any] | None:
+    """Parse FORMAT 3 (old_hgal) bill text."""
+    # FORMAT 3 - OLD: Two-line format with meter ID
+    # The anchored charge line is checked before the unanchored meter reading
+    # pattern, which is tried at every digit
+    if (
+        "TOTAL USAGE ALL METERS" not in text
+        or (anchor := text.find("Water Residential Service")) < 0
+        or not (charge_match := _OLD_CHARGE_PATTERN.search(text, anchor))
+        or not (reading_match := _OLD_READING_PATTERN.search(text))
+    ):
+        return None
+
+    return {
+        "service_from": reading_match.group(2),
+        "service_to": reading_match.group(3),
+        "prior_reading": int(reading_match.group(4).replace(",", "")),
+        "current_reading": int(reading_match.group(5).replace(",", "")),
+        "usage_gallons": int(reading_match.group(6)) * 100,  # HGAL
+        "charges": float(charge_match.group(2)),
+        "format": "old_hgal",
+    }
+
+
+# Bill parsers in priority order; the first one that matches wins
+_BILL_PARSERS = (_parse_charge_line, _parse_meter_lines)
+
+
+def _resolve_date_range(
+    start_date: str | None, end_date: str | None, days: int
+) -> tuple[str, str]:
+    """Fill in missing dates with a range of `days` ending today (YYYY-MM-DD)."""
+    if start_date and end_date:
+        return start_date, end_date
+
+    today = datetime.now()
+    return (
+        start_date or (today - timedelta(days=days)).strftime(_DATE_FORMAT),
+        end_date or today.strftime(_DATE_FORMAT),
+    )
+
+
+def _is_transient_error(err: Exception) -> bool:
+    """Return True for errors worth riding out with a cached response."""
+    if isinstance(err, aiohttp.ClientResponseError):
+        return err.status >= 500
+    return isinstance(err, (aiohttp.ClientError, TimeoutError))
+
+
+def _token_expiry(token: str) -> float:
+    """Return the expiry (exp claim, seconds since epoch) of a JWT."""
+    payload = token.split(".")[1]
+    payload += "=" * (-len(payload) % 4)
+    return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+
 
 class DelCoWaterAPI:
     """API client for Del-Co Water."""
 
-    def __init__(self, username: str, password: str) -> None:
+    def __init__(
+        self, session: aiohttp.ClientSession, username: str, password: str
+    ) -> None:
         """Initialize the API client."""
+        self._session = session
         self.username = username
         self.password = password
         self.access_token: str | None = None
         self.id_token: str | None = None
+        self._token_expires_at = 0.0
         self._cognito: Cognito | None = None
-        self._account_data: dict[str, Any] | None = None
+        # Response cache: key -> (monotonic fetch time, response)
+        self._cache: dict[tuple[str | None, ...], tuple[float, Any]] = {}
+        # Requests currently in flight, keyed by endpoint and payload
+        self._inflight: dict[tuple[Any, ...], asyncio.Task[dict[str, Any]]] = {}
+        # Parsed bill PDFs keyed by "<bill_id>_<bill_date>"; bills never change
+        # once issued, so the owner may persist and restore this mapping
+        self.parsed_bills: dict[str, dict[str, Any]] = {}
+        self._pdf_download_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_PDF_DOWNLOADS)
+        self._pdf_parse_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_PDF_PARSES)
 
     def authenticate(self) -> None:
         """Authenticate with AWS Cognito."""
@@ -49,8 +222,7 @@ class DelCoWaterAPI:
             self._cognito.authenticate(password=self.password)
 
             # Get tokens
-            self.access_token = self._cognito.access_token
-            self.id_token = self._cognito.id_token
+            self._update_tokens()
 
             _LOGGER.debug("Successfully authenticated with Cognito")
 
@@ -58,6 +230,46 @@ class DelCoWaterAPI:
             _LOGGER.error("Authentication failed: %s", err)
             raise
 
+    def _update_tokens(self) -> None:
+        """Copy the current tokens and their expiry from the Cognito client."""
+        self.access_token = self._cognito.access_token
+        self.id_token = self._cognito.id_token
+        self._token_expires_at = _token_expiry(self.access_token)
+
+    def ensure_authenticated(self) -> None:
+        """Make sure a valid access token is available.
+
+        The current token is reused until shortly before it expires and is then
+        renewed with the refresh token (a single request). The full SRP
+        authentication only runs on first use or if the renewal fails.
+        """
+        if self._cognito is None or not self.access_token:
+            self.authenticate()
+            return
+
+        if time.time() < self._token_expires_at - _TOKEN_EXPIRY_MARGIN:
+            return
+
+        try:
+            self._cognito.renew_access_token()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Token renewal failed, re-authenticating: %s", err)
+            self.authenticate()
+            return
+
+        self._update_tokens()
+        _LOGGER.debug("Renewed Cognito access token")
+
+    async def async_authenticate(self) -> None:
+        """Authenticate with AWS Cognito without blocking the event loop."""
+        await asyncio.get_running_loop().run_in_executor(None, self.authenticate)
+
+    async def async_ensure_authenticated(self) -> None:
+        """Reuse or renew the access token without blocking the event loop."""
+        await asyncio.get_running_loop().run_in_executor(
+            None, self.ensure_authenticated
+        )
+
     def _get_headers(self) -> dict[str, str]:
         """Get headers for API requests."""
         if not self.access_token:
@@ -68,25 +280,102 @@ class DelCoWaterAPI:
             "Content-Type": "application/json",
         }
 
-    def get_account(self) -> dict[str, Any]:
+    async def _async_post(
+        self, path: str, payload: dict[str, Any]
+    ) -> dict[str, Any]:
+        """POST a JSON payload to an API endpoint and return the decoded response.
+
+        Identical requests that are already in flight are shared rather than
+        sent again; every caller awaits the same underlying request.
+        """
+        key = (path, *sorted(payload.items()))
+        if (request := self._inflight.get(key)) is None:
+            request = asyncio.create_task(self._async_send_post(path, payload))
+            self._inflight[key] = request
+            request.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so one cancelled caller doesn't cancel the shared request
+        return await asyncio.shield(request)
+
+    async def _async_send_post(
+        self, path: str, payload: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Send a POST request and return the decoded JSON response."""
+        async with self._session.post(
+            f"{API_BASE_URL}{path}",
+            headers=self._get_headers(),
+            json=payload,
+            timeout=_TIMEOUT,
+        ) as response:
+            response.raise_for_status()
+            # Home Assistant's json_loads is backed by orjson
+            return await response.json(loads=json_loads)
+
+    async def _async_cached_post(
+        self,
+        path: str,
+        payload: dict[str, Any],
+        key: tuple[str | None, ...],
+        ttl: float,
+    ) -> dict[str, Any]:
+        """POST to an endpoint, serving the cached response while it is fresh.
+
+        If the request fails with a transient error (timeout, connection
+        problem or 5xx) and a response younger than STALE_CACHE_MAX_AGE is
+        cached, the stale response is returned instead of raising. Callers
+        key default-range requests by their unresolved (None) dates so that a
+        refresh on a later day, whose resolved range differs, still finds the
+        previous response.
+        """
+        cached = self._cache.get(key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        try:
+            data = await self._async_post(path, payload)
+        except (aiohttp.ClientError, TimeoutError) as err:
+            if (
+                not cached
+                or not _is_transient_error(err)
+                or time.monotonic() - cached[0] > STALE_CACHE_MAX_AGE
+            ):
+                raise
+            _LOGGER.warning(
+                "Request to %s failed, using cached response: %s", path, err
+            )
+            return cached[1]
+
+        now = time.monotonic()
+        # Drop entries too old to be served even as a stale fallback, so
+        # explicit date ranges don't accumulate for the life of the client
+        for old_key in [
+            k for k, (fetched, _) in self._cache.items()
+            if now - fetched > STALE_CACHE_MAX_AGE
+        ]:
+            del self._cache[old_key]
+        self._cache[key] = (now, data)
+        return data
+
+    async def async_get_account(self) -> dict[str, Any]:
         """Get account information."""
         try:
             # The account endpoint expects AccessToken in body
-            response = requests.post(
-                f"{API_BASE_URL}/account",
-                headers=self._get_headers(),
-                json={"AccessToken": self.access_token},
-                timeout=30,
+            return await self._async_cached_post(
+                "/account",
+                {"AccessToken": self.access_token},
+                ("/account",),
+                ACCOUNT_CACHE_TTL,
             )
-            response.raise_for_status()
-            data = response.json()
-            self._account_data = data  # Cache for usage requests
-            return data
         except Exception as err:
             _LOGGER.error("Failed to get account data: %s", err)
             raise
 
-    def get_usage(
+    async def _async_get_account_info(self) -> dict[str, Any]:
+        """Get the myAccount section of the (cached) account data."""
+        account_data = await self.async_get_account()
+        return account_data.get("myAccount", {})
+
+    async def async_get_usage(
         self,
         frequency: str = FREQUENCY_DAILY,
         start_date: str | None = None,
@@ -100,12 +389,8 @@ class DelCoWaterAPI:
             end_date: End date in YYYY-MM-DD format (defaults to today)
         """
         try:
-            # Get account data first if not cached
-            if not self._account_data:
-                self.get_account()
-
             # Extract required fields from account data
-            account_info = self._account_data.get("myAccount", {})
+            account_info = await self._async_get_account_info()
             service_addresses = account_info.get("serviceAddresses", [])
 
             if not service_addresses:
@@ -114,11 +399,10 @@ class DelCoWaterAPI:
             premise_id = service_addresses[0].get("premiseId")
             account_id = account_info.get("accountId")
 
+            # Unresolved dates in the key: see _async_cached_post
+            key = ("/usage", frequency, start_date, end_date)
             # Default date range: 1 year
-            if not end_date:
-                end_date = datetime.now().strftime("%Y-%m-%d")
-            if not start_date:
-                start_date = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
+            start_date, end_date = _resolve_date_range(start_date, end_date, 365)
 
             payload = {
                 "AccessToken": self.access_token,
@@ -132,34 +416,27 @@ class DelCoWaterAPI:
                 "email": self.username,
             }
 
-            response = requests.post(
-                f"{API_BASE_URL}/usage",
-                headers=self._get_headers(),
-                json=payload,
-                timeout=30,
+            return await self._async_cached_post(
+                "/usage",
+                payload,
+                key,
+                USAGE_CACHE_TTL,
             )
-            response.raise_for_status()
-            return response.json()
         except Exception as err:
             _LOGGER.error("Failed to get usage data: %s", err)
             raise
 
-    def get_ic(self) -> dict[str, Any]:
+    async def async_get_ic(self) -> dict[str, Any]:
         """Get IC (Installation/Connection) authentication data."""
         try:
-            response = requests.post(
-                f"{API_BASE_URL}/auth/ic",
-                headers=self._get_headers(),
-                json={"AccessToken": self.access_token},
-                timeout=30,
+            return await self._async_post(
+                "/auth/ic", {"AccessToken": self.access_token}
             )
-            response.raise_for_status()
-            return response.json()
         except Exception as err:
             _LOGGER.error("Failed to get IC data: %s", err)
             raise
 
-    def get_billing_history(
+    async def async_get_billing_history(
         self,
         start_date: str | None = None,
         end_date: str | None = None,
@@ -174,18 +451,13 @@ class DelCoWaterAPI:
             Billing history with dates and amounts
         """
         try:
-            # Get account data first if not cached
-            if not self._account_data:
-                self.get_account()
-
-            account_info = self._account_data.get("myAccount", {})
+            account_info = await self._async_get_account_info()
             account_id = account_info.get("accountId")
 
+            # Unresolved dates in the key: see _async_cached_post
+            key = ("/history/billing", start_date, end_date)
             # Default date range: 1 year
-            if not end_date:
-                end_date = datetime.now().strftime("%Y-%m-%d")
-            if not start_date:
-                start_date = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
+            start_date, end_date = _resolve_date_range(start_date, end_date, 365)
 
             payload = {
                 "AccessToken": self.access_token,
@@ -196,19 +468,17 @@ class DelCoWaterAPI:
                 "email": self.username,
             }
 
-            response = requests.post(
-                f"{API_BASE_URL}/history/billing",
-                headers=self._get_headers(),
-                json=payload,
-                timeout=30,
+            return await self._async_cached_post(
+                "/history/billing",
+                payload,
+                key,
+                BILLING_CACHE_TTL,
             )
-            response.raise_for_status()
-            return response.json()
         except Exception as err:
             _LOGGER.error("Failed to get billing history: %s", err)
             raise
 
-    def get_payment_history(
+    async def async_get_payment_history(
         self,
         start_date: str | None = None,
         end_date: str | None = None,
@@ -223,18 +493,13 @@ class DelCoWaterAPI:
             Payment history with dates, amounts, tender types and sources
         """
         try:
-            # Get account data first if not cached
-            if not self._account_data:
-                self.get_account()
-
-            account_info = self._account_data.get("myAccount", {})
+            account_info = await self._async_get_account_info()
             account_id = account_info.get("accountId")
 
+            # Unresolved dates in the key: see _async_cached_post
+            key = ("/history/payment", start_date, end_date)
             # Default date range: 2 years (as shown in user's CURL example)
-            if not end_date:
-                end_date = datetime.now().strftime("%Y-%m-%d")
-            if not start_date:
-                start_date = (datetime.now() - timedelta(days=730)).strftime("%Y-%m-%d")
+            start_date, end_date = _resolve_date_range(start_date, end_date, 730)
 
             payload = {
                 "AccessToken": self.access_token,
@@ -245,31 +510,27 @@ class DelCoWaterAPI:
                 "email": self.username,
             }
 
-            response = requests.post(
-                f"{API_BASE_URL}/history/payment",
-                headers=self._get_headers(),
-                json=payload,
-                timeout=30,
+            return await self._async_cached_post(
+                "/history/payment",
+                payload,
+                key,
+                PAYMENT_CACHE_TTL,
             )
-            response.raise_for_status()
-            return response.json()
         except Exception as err:
             _LOGGER.error("Failed to get payment history: %s", err)
             raise
 
-    def _get_bill_pdf_base_url(self) -> str:
+    async def _async_get_bill_pdf_base_url(self) -> str:
         """Get the base URL for bill PDFs from account data."""
-        if not self._account_data:
-            self.get_account()
-
-        bill_url = self._account_data.get("myAccount", {}).get("billDisplayURL", "")
+        account_info = await self._async_get_account_info()
+        bill_url = account_info.get("billDisplayURL", "")
         if not bill_url:
             raise ValueError("No bill URL found in account data")
 
         # Extract base URL (everything before the filename)
         return bill_url.rsplit("/", 1)[0]
 
-    def get_bill_pdf(self, bill_id: str, bill_date: str) -> bytes | None:
+    async def async_get_bill_pdf(self, bill_id: str, bill_date: str) -> bytes | None:
         """Download a bill PDF.
 
         Args:
@@ -280,23 +541,21 @@ class DelCoWaterAPI:
             PDF content as bytes, or None if not found
         """
         try:
-            if not self._account_data:
-                self.get_account()
-
-            base_url = self._get_bill_pdf_base_url()
-            account_id = self._account_data.get("myAccount", {}).get("accountId")
+            base_url = await self._async_get_bill_pdf_base_url()
+            account_info = await self._async_get_account_info()
+            account_id = account_info.get("accountId")
             bill_date_formatted = bill_date.replace("-", "")  # 2025-08-13 -> 20250813
 
             pdf_url = f"{base_url}/{account_id}_{bill_id}_{bill_date_formatted}.pdf"
 
-            response = requests.get(pdf_url, timeout=30)
-            if response.status_code == 200:
-                return response.content
+            async with self._session.get(pdf_url, timeout=_TIMEOUT) as response:
+                if response.status == 200:
+                    return await response.read()
 
-            _LOGGER.warning(
-                "Bill PDF not found: %s (HTTP %d)", pdf_url, response.status_code
-            )
-            return None
+                _LOGGER.warning(
+                    "Bill PDF not found: %s (HTTP %d)", pdf_url, response.status
+                )
+                return None
 
         except Exception as err:
             _LOGGER.error("Failed to get bill PDF %s: %s", bill_id, err)
@@ -318,7 +577,9 @@ class DelCoWaterAPI:
             or None if parsing fails
         """
         try:
-            with pdfplumber.open(BytesIO(pdf_content)) as pdf:
+            # All bill formats carry the usage table on the first page, so
+            # only that page is loaded and laid out
+            with pdfplumber.open(BytesIO(pdf_content), pages=[1]) as pdf:
                 if not pdf.pages:
                     return None
 
@@ -326,69 +587,9 @@ class DelCoWaterAPI:
                 if not text:
                     return None
 
-                # FORMAT 1 - NEW (2025-08+): Usage in GALLONS, no hyphen between dates
-                # Water Residential Charge ADDR PREMISE MM/DD/YY MM/DD/YY PRIOR CURR USAGE $CHG
-                new_pattern = (
-                    r"Water Residential Charge\s+.*?"
-                    r"(\d{2}/\d{2}/\d{2})\s+(\d{2}/\d{2}/\d{2})\s+"
-                    r"(\d+)\s+(\d+)\s+(\d+)\s+\$?([\d.]+)"
-                )
-                match = re.search(new_pattern, text)
-                if match:
-                    return {
-                        "service_from": match.group(1),
-                        "service_to": match.group(2),
-                        "prior_reading": int(match.group(3)),
-                        "current_reading": int(match.group(4)),
-                        "usage_gallons": int(match.group(5)),  # Already in gallons
-                        "charges": float(match.group(6)),
-                        "format": "new_gallons",
-                    }
-
-                # FORMAT 2 - MID: Usage in HGAL, hyphen between dates, commas in readings
-                # Water (Residential Charge|Charges...) ADDR PREMISE MM/DD/YY - MM/DD/YY ...
-                mid_pattern = (
-                    r"Water (?:Residential Charge|Charges[^\d]*)\s+.*?"
-                    r"(\d{2}/\d{2}/\d{2})\s*-\s*(\d{2}/\d{2}/\d{2})\s+"
-                    r"([\d,]+)\s+([\d,]+)\s+(\d+)\s+\$?([\d.]+)"
-                )
-                match = re.search(mid_pattern, text)
-                if match:
-                    return {
-                        "service_from": match.group(1),
-                        "service_to": match.group(2),
-                        "prior_reading": int(match.group(3).replace(",", "")),
-                        "current_reading": int(match.group(4).replace(",", "")),
-                        "usage_gallons": int(match.group(5)) * 100,  # HGAL to gallons
-                        "charges": float(match.group(6)),
-                        "format": "mid_hgal",
-                    }
-
-                # FORMAT 3 - OLD: Two-line format with meter ID
-                # METER_ID MM/DD/YY - MM/DD/YY Actual PRIOR CURRENT USAGE_HGAL
-                # Water Residential Service DAYS TOTAL USAGE ALL METERS HGAL GPD $CHARGE
-                old_reading_pattern = (
-                    r"(\d+)\s+(\d{2}/\d{2}/\d{2})\s*-\s*(\d{2}/\d{2}/\d{2})\s+"
-                    r"Actual\s+([\d,]+)\s+([\d,]+)\s+(\d+)"
-                )
-                old_charge_pattern = (
-                    r"Water Residential Service\s+\d+\s+"
-                    r"TOTAL USAGE ALL METERS\s+(\d+)\s+[\d.]+\s+\$?([\d.]+)"
-                )
-
-                reading_match = re.search(old_reading_pattern, text)
-                charge_match = re.search(old_charge_pattern, text)
-
-                if reading_match and charge_match:
-                    return {
-                        "service_from": reading_match.group(2),
-                        "service_to": reading_match.group(3),
-                        "prior_reading": int(reading_match.group(4).replace(",", "")),
-                        "current_reading": int(reading_match.group(5).replace(",", "")),
-                        "usage_gallons": int(reading_match.group(6)) * 100,  # HGAL
-                        "charges": float(charge_match.group(2)),
-                        "format": "old_hgal",
-                    }
+                for parser in _BILL_PARSERS:
+                    if result := parser(text):
+                        return result
 
                 _LOGGER.warning("Could not parse bill PDF - unknown format")
                 return None
@@ -397,7 +598,59 @@ class DelCoWaterAPI:
             _LOGGER.error("Failed to parse bill PDF: %s", err)
             return None
 
-    def get_billing_with_usage(
+    async def async_parse_bill_pdf(
+        self, pdf_content: bytes
+    ) -> dict[str, Any] | None:
+        """Parse a bill PDF in the executor (pdfplumber is CPU-bound).
+
+        Parses are bounded so a first-run backfill of many bills doesn't
+        occupy every executor thread, which other integrations share.
+        """
+        async with self._pdf_parse_semaphore:
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self.parse_bill_pdf, pdf_content
+            )
+
+    async def _async_fetch_bill_with_usage(
+        self, bill: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Download and parse the PDF for one billing history entry."""
+        bill_id = bill.get("billId")
+        bill_date = bill.get("billDate")
+
+        if not bill_id or not bill_date:
+            return None
+
+        cache_key = f"{bill_id}_{bill_date}"
+        if (parsed := self.parsed_bills.get(cache_key)) is None:
+            async with self._pdf_download_semaphore:
+                pdf_content = await self.async_get_bill_pdf(bill_id, bill_date)
+            if not pdf_content:
+                _LOGGER.warning(
+                    "Could not fetch PDF for bill %s (%s)", bill_id, bill_date
+                )
+                return None
+
+            parsed = await self.async_parse_bill_pdf(pdf_content)
+            if not parsed:
+                _LOGGER.warning(
+                    "Could not parse PDF for bill %s (%s)", bill_id, bill_date
+                )
+                return None
+
+            self.parsed_bills[cache_key] = parsed
+
+        # Merge billing API data with parsed PDF data
+        return {
+            "bill_id": bill_id,
+            "bill_date": bill_date,
+            "read_date": bill.get("readDate"),
+            "due_date": bill.get("dueDate"),
+            "bill_amount": bill.get("billAmount"),
+            **parsed,
+        }
+
+    async def async_get_billing_with_usage(
         self,
         start_date: str | None = None,
         end_date: str | None = None,
@@ -405,7 +658,9 @@ class DelCoWaterAPI:
         """Get billing history enriched with per-period usage from PDFs.
 
         This method fetches billing history and then downloads/parses each
-        bill PDF to extract the actual usage for each billing period.
+        bill PDF concurrently to extract the actual usage for each billing
+        period. Bills already present in ``parsed_bills`` are not downloaded
+        again.
 
         Args:
             start_date: Start date in YYYY-MM-DD format (defaults to 1 year ago)
@@ -414,43 +669,25 @@ class DelCoWaterAPI:
         Returns:
             List of billing records with usage data included
         """
-        billing_data = self.get_billing_history(start_date, end_date)
-        results = []
-
-        for bill in billing_data.get("billing", []):
-            bill_id = bill.get("billId")
-            bill_date = bill.get("billDate")
-
-            if not bill_id or not bill_date:
-                continue
+        billing_data = await self.async_get_billing_history(start_date, end_date)
 
-            pdf_content = self.get_bill_pdf(bill_id, bill_date)
-            if not pdf_content:
-                _LOGGER.warning(
-                    "Could not fetch PDF for bill %s (%s)", bill_id, bill_date
-                )
-                continue
+        # Download and parse every bill concurrently; results keep bill order
+        fetched = await asyncio.gather(
+            *(
+                self._async_fetch_bill_with_usage(bill)
+                for bill in billing_data.get("billing", [])
+            )
+        )
+        results = [record for record in fetched if record]
 
-            parsed = self.parse_bill_pdf(pdf_content)
-            if not parsed:
-                _LOGGER.warning(
-                    "Could not parse PDF for bill %s (%s)", bill_id, bill_date
-                )
-                continue
-
-            # Merge billing API data with parsed PDF data
-            results.append({
-                "bill_id": bill_id,
-                "bill_date": bill_date,
-                "read_date": bill.get("readDate"),
-                "due_date": bill.get("dueDate"),
-                "bill_amount": bill.get("billAmount"),
-                **parsed,
-            })
-
-        # Sort by service_to date
+        # Sort by service_to date; MM/DD/YY reordered as YYMMDD sorts
+        # chronologically without parsing
         results.sort(
-            key=lambda x: datetime.strptime(x["service_to"], "%m/%d/%y")
+            key=lambda x: (
+                x["service_to"][6:8],
+                x["service_to"][0:2],
+                x["service_to"][3:5],
+            )
         )
 
         _LOGGER.info(
@@ -10,6 +10,7 @@ from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import DelCoWaterAPI
 from .const import DOMAIN
@@ -39,12 +40,13 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             try:
                 # Validate the credentials
                 api = DelCoWaterAPI(
+                    async_get_clientsession(self.hass),
                     user_input[CONF_USERNAME],
                     user_input[CONF_PASSWORD]
                 )
 
                 # Test authentication
-                await self.hass.async_add_executor_job(api.authenticate)
+                await api.async_authenticate()
 
                 # Create the config entry
                 return self.async_create_entry(
@@ -11,6 +11,19 @@ COGNITO_REGION = "us-east-2"
 COGNITO_USER_POOL_ID = "us-east-2_OicSaC5QT"
 COGNITO_CLIENT_ID = "2uh8gm2iusiquj7m2tt55dfpce"
 
+# Response cache lifetimes (seconds)
+ACCOUNT_CACHE_TTL = 3600  # 1 hour
+USAGE_CACHE_TTL = 900  # 15 minutes
+BILLING_CACHE_TTL = 21600  # 6 hours - bills are issued monthly
+PAYMENT_CACHE_TTL = 86400  # 24 hours
+# Oldest cached response served when the API is temporarily unavailable
+STALE_CACHE_MAX_AGE = 172800  # 48 hours
+
+# Persistent storage for parsed bill PDFs
+BILL_CACHE_STORAGE_KEY = f"{DOMAIN}_bills"
+BILL_CACHE_STORAGE_VERSION = 1
+BILL_CACHE_SAVE_DELAY = 30  # seconds
+
 # Usage frequency options
 # Note: Only monthly frequency is available for non-AMI meters
 # AMI (Advanced Metering Infrastructure) meters may support additional frequencies
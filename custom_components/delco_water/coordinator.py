@@ -1,8 +1,12 @@
 """DataUpdateCoordinator for Del-Co Water."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import datetime, timedelta, timezone
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone, tzinfo
+from itertools import accumulate
+from typing import Any
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.statistics import (
@@ -11,14 +15,18 @@ from homeassistant.components.recorder.statistics import (
     get_last_statistics,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
+from homeassistant.util.async_ import create_eager_task
 
 from .api import DelCoWaterAPI
 from .const import (
+    BILL_CACHE_SAVE_DELAY,
+    BILL_CACHE_STORAGE_KEY,
+    BILL_CACHE_STORAGE_VERSION,
     CONSUMPTION_METADATA,
     COST_METADATA,
-    FREQUENCY_MONTHLY,
     STATISTIC_CONSUMPTION,
     STATISTIC_COST,
 )
@@ -26,10 +34,35 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+def _build_statistics(
+    starts: list[datetime], values: list[float], last_time: datetime | None
+) -> list[StatisticData]:
+    """Build statistics for the periods after last_time.
+
+    starts must be sorted. state is the period's value and sum the cumulative
+    total, which always includes the periods already recorded.
+    """
+    first = bisect_right(starts, last_time) if last_time else 0
+    sums = list(accumulate(values))
+    return [
+        {"start": start, "state": state, "sum": total}
+        for start, state, total in zip(starts[first:], values[first:], sums[first:])
+    ]
+
+
+def bill_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, dict[str, Any]]]:
+    """Return the store of parsed bills for a config entry."""
+    return Store(
+        hass, BILL_CACHE_STORAGE_VERSION, f"{BILL_CACHE_STORAGE_KEY}.{entry_id}"
+    )
+
+
 class DelCoWaterCoordinator(DataUpdateCoordinator):
     """Del-Co Water data update coordinator."""
 
-    def __init__(self, hass: HomeAssistant, api: DelCoWaterAPI) -> None:
+    def __init__(
+        self, hass: HomeAssistant, api: DelCoWaterAPI, entry_id: str
+    ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
@@ -38,35 +71,57 @@ class DelCoWaterCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(hours=24),
         )
         self.api = api
+        # One store per config entry so accounts don't overwrite each other
+        self._bill_store = bill_store(hass, entry_id)
+        self._bill_cache_loaded = False
+        # Start of the newest inserted statistics; read from the recorder once
+        # and then kept up to date as new statistics are inserted
+        self._last_consumption_time: datetime | None = None
+        self._last_cost_time: datetime | None = None
+        self._last_stat_times_loaded = False
+        # HA's configured timezone, resolved once per statistics pass
+        self._local_tz: tzinfo = timezone.utc
+        # Parsed service dates; bills repeat on every refresh
+        self._date_cache: dict[str, datetime] = {}
 
     async def _async_update_data(self) -> dict:
         """Fetch data from API and insert statistics."""
         try:
-            # Authenticate and fetch data
-            await self.hass.async_add_executor_job(self.api.authenticate)
-            account_data = await self.hass.async_add_executor_job(self.api.get_account)
-
-            # Fetch billing with usage from PDFs (new method)
-            billing_with_usage = await self.hass.async_add_executor_job(
-                self.api.get_billing_with_usage
-            )
-
-            # Also fetch regular billing/payment for sensors
-            billing_data = await self.hass.async_add_executor_job(
-                self.api.get_billing_history
-            )
-            payment_data = await self.hass.async_add_executor_job(
-                self.api.get_payment_history
-            )
-
-            # Keep usage API call for sensor display (shows latest month)
-            usage_data = await self.hass.async_add_executor_job(
-                self.api.get_usage, FREQUENCY_MONTHLY
+            # Authenticate (reusing the token from the last refresh if still
+            # valid) and fetch data
+            await self.api.async_ensure_authenticated()
+
+            # Restore previously parsed bills so their PDFs aren't re-fetched
+            if not self._bill_cache_loaded:
+                self.api.parsed_bills = await self._bill_store.async_load() or {}
+                self._bill_cache_loaded = True
+
+            # All requests run concurrently; the API shares identical requests
+            # that are in flight, so /account and /history/billing are still
+            # only fetched once
+            parsed_count = len(self.api.parsed_bills)
+            (
+                account_data,
+                billing_with_usage,
+                billing_data,
+                payment_data,
+            ) = await asyncio.gather(
+                create_eager_task(self.api.async_get_account()),
+                # Billing with usage from PDFs (new method)
+                create_eager_task(self.api.async_get_billing_with_usage()),
+                # Regular billing/payment for sensors
+                create_eager_task(self.api.async_get_billing_history()),
+                create_eager_task(self.api.async_get_payment_history()),
             )
+            if len(self.api.parsed_bills) != parsed_count:
+                self._bill_store.async_delay_save(
+                    lambda: self.api.parsed_bills, BILL_CACHE_SAVE_DELAY
+                )
 
             data = {
                 "account": account_data,
-                "usage": usage_data,
+                # Hoisted once per update so sensors don't re-walk the response
+                "my_account": account_data.get("myAccount", {}),
                 "billing": billing_data,
                 "payment": payment_data,
                 "billing_with_usage": billing_with_usage,
@@ -91,51 +146,58 @@ class DelCoWaterCoordinator(DataUpdateCoordinator):
         Returns:
             Timezone-aware datetime at noon local time (to avoid date shifts)
         """
-        # Parse the date
-        dt = datetime.strptime(date_str, "%m/%d/%y")
-
-        # Get HA's configured timezone
-        local_tz = dt_util.get_time_zone(self.hass.config.time_zone)
-
-        # Set to noon local time to avoid any date boundary issues
-        # when converting to/from UTC
-        dt = dt.replace(hour=12, minute=0, second=0, microsecond=0)
-
-        # Make timezone-aware in local timezone, then convert to UTC
-        # (HA statistics are stored in UTC)
-        if local_tz:
-            dt = dt.replace(tzinfo=local_tz)
-            dt = dt.astimezone(timezone.utc)
-        else:
-            dt = dt.replace(tzinfo=timezone.utc)
-
+        if (cached := self._date_cache.get(date_str)) is not None:
+            return cached
+
+        if len(date_str) != 8:
+            raise ValueError(f"Invalid service date: {date_str!r}")
+
+        # Parse the fixed-width date directly; strptime's format machinery is
+        # much slower for a shape this simple. Noon local time avoids any date
+        # boundary issues when converting to UTC (HA statistics are stored in
+        # UTC)
+        dt = datetime(
+            2000 + int(date_str[6:8]),
+            int(date_str[0:2]),
+            int(date_str[3:5]),
+            12,
+            tzinfo=self._local_tz,
+        ).astimezone(timezone.utc)
+
+        self._date_cache[date_str] = dt
         return dt
 
-    async def _get_last_stat_time(self, statistic_id: str) -> datetime | None:
-        """Get the timestamp of the last inserted statistic."""
+    def _get_last_stat_time(self, statistic_id: str) -> datetime | None:
+        """Get the timestamp of the last inserted statistic.
+
+        Must be run in the recorder's executor.
+        """
         try:
-            last_stats = await get_instance(self.hass).async_add_executor_job(
-                get_last_statistics,
+            last_stats = get_last_statistics(
                 self.hass,
                 1,
                 statistic_id,
                 True,
                 set(),
             )
-
-            if last_stats and statistic_id in last_stats:
-                stats_list = last_stats[statistic_id]
-                if stats_list and len(stats_list) > 0:
-                    last_stat = stats_list[0]
-                    if "start" in last_stat:
-                        return datetime.fromtimestamp(
-                            last_stat["start"], tz=timezone.utc
-                        )
+            return datetime.fromtimestamp(
+                last_stats[statistic_id][0]["start"], tz=timezone.utc
+            )
+        except (KeyError, IndexError):
+            # Nothing recorded yet for this statistic
+            pass
         except Exception as err:
             _LOGGER.warning("Failed to get last statistics for %s: %s", statistic_id, err)
 
         return None
 
+    def _get_last_stat_times(self) -> tuple[datetime | None, datetime | None]:
+        """Get the last consumption and cost statistic times in one recorder job."""
+        return (
+            self._get_last_stat_time(STATISTIC_CONSUMPTION),
+            self._get_last_stat_time(STATISTIC_COST),
+        )
+
     async def _insert_statistics(self, data: dict) -> None:
         """Insert long-term statistics for consumption and cost.
 
@@ -149,20 +211,44 @@ class DelCoWaterCoordinator(DataUpdateCoordinator):
             _LOGGER.warning("No billing data with usage available from PDFs")
             return
 
-        # Get last inserted statistics to avoid duplicates
-        last_consumption_time = await self._get_last_stat_time(STATISTIC_CONSUMPTION)
-        last_cost_time = await self._get_last_stat_time(STATISTIC_COST)
-
-        _LOGGER.debug("Last consumption time: %s", last_consumption_time)
-        _LOGGER.debug("Last cost time: %s", last_cost_time)
+        # Look up HA's configured timezone once rather than per bill; parsed
+        # dates depend on it, so drop them if it has changed
+        local_tz = dt_util.get_time_zone(self.hass.config.time_zone) or timezone.utc
+        if local_tz != self._local_tz:
+            self._local_tz = local_tz
+            self._date_cache.clear()
 
-        # Build statistics lists
-        consumption_statistics = []
-        cost_statistics = []
-        consumption_sum = 0.0
-        cost_sum = 0.0
+        # Get last inserted statistics to avoid duplicates
+        if not self._last_stat_times_loaded:
+            self._last_consumption_time, self._last_cost_time = await get_instance(
+                self.hass
+            ).async_add_executor_job(self._get_last_stat_times)
+            self._last_stat_times_loaded = True
+
+        last_consumption_time = self._last_consumption_time
+        last_cost_time = self._last_cost_time
+
+        _LOGGER.debug(
+            "Last consumption time: %s, last cost time: %s",
+            last_consumption_time,
+            last_cost_time,
+        )
 
-        # Process billing data (already sorted by service_to in API)
+        # Bills arrive monthly, so most refreshes bring nothing new; skip the
+        # whole pass when the newest bill (list is sorted) is already recorded
+        if last_consumption_time and last_cost_time:
+            try:
+                latest = self._parse_service_date(billing_with_usage[-1]["service_to"])
+            except (ValueError, TypeError, KeyError):
+                latest = None
+            if latest and latest <= min(last_consumption_time, last_cost_time):
+                _LOGGER.debug("No new billing periods since %s", latest)
+                return
+
+        # Parse each bill once (already sorted by service_to in API)
+        starts: list[datetime] = []
+        gallons: list[float] = []
+        costs: list[float] = []
         for bill in billing_with_usage:
             try:
                 # Parse service_to date as the statistics timestamp
@@ -170,37 +256,22 @@ class DelCoWaterCoordinator(DataUpdateCoordinator):
                 period_start = self._parse_service_date(bill["service_to"])
 
                 # Get values
-                gallons = float(bill["usage_gallons"])
-                cost = float(bill["charges"])
-
-                # Update cumulative sums (always, even for skipped periods)
-                consumption_sum += gallons
-                cost_sum += cost
-
-                # Insert consumption statistic if not already present
-                if not last_consumption_time or period_start > last_consumption_time:
-                    consumption_statistics.append(
-                        StatisticData(
-                            start=period_start,
-                            state=gallons,  # This period's usage
-                            sum=consumption_sum,  # Cumulative total
-                        )
-                    )
-
-                # Insert cost statistic if not already present
-                if not last_cost_time or period_start > last_cost_time:
-                    cost_statistics.append(
-                        StatisticData(
-                            start=period_start,
-                            state=cost,  # This period's cost
-                            sum=cost_sum,  # Cumulative total
-                        )
-                    )
-
+                bill_gallons = float(bill["usage_gallons"])
+                bill_cost = float(bill["charges"])
             except (ValueError, TypeError, KeyError) as err:
                 _LOGGER.warning("Failed to process billing record %s: %s", bill, err)
                 continue
 
+            starts.append(period_start)
+            gallons.append(bill_gallons)
+            costs.append(bill_cost)
+
+        # Only build statistics that are not already present
+        consumption_statistics = _build_statistics(
+            starts, gallons, last_consumption_time
+        )
+        cost_statistics = _build_statistics(starts, costs, last_cost_time)
+
         # Insert consumption statistics
         if consumption_statistics:
             _LOGGER.info(
@@ -211,6 +282,7 @@ class DelCoWaterCoordinator(DataUpdateCoordinator):
             async_add_external_statistics(
                 self.hass, CONSUMPTION_METADATA, consumption_statistics, mean_type=None
             )
+            self._last_consumption_time = consumption_statistics[-1]["start"]
         else:
             _LOGGER.debug("No new consumption statistics to insert")
 
@@ -224,5 +296,6 @@ class DelCoWaterCoordinator(DataUpdateCoordinator):
             async_add_external_statistics(
                 self.hass, COST_METADATA, cost_statistics, mean_type=None
             )
+            self._last_cost_time = cost_statistics[-1]["start"]
         else:
             _LOGGER.debug("No new cost statistics to insert")
@@ -29,37 +29,27 @@ class DelCoWaterSensorEntityDescription(SensorEntityDescription):
 
 
 def _get_latest_water_usage(data: dict[str, Any]) -> StateType:
-    """Extract latest water usage from usage data."""
-    usage = data.get("usage", {}).get("usage", {})
-    usage_history = usage.get("usageHistory", [])
+    """Extract latest water usage from the PDF-parsed billing data."""
+    billing_with_usage = data.get("billing_with_usage")
 
-    if not usage_history:
+    if not billing_with_usage:
         return None
 
-    # Get the first history entry (Water Meter Consumption)
-    history = usage_history[0]
-    usage_data = history.get("usageData", [])
+    # Bills are sorted by service_to, so the last one is the latest month
+    gallons = billing_with_usage[-1].get("usage_gallons")
 
-    if not usage_data:
-        return None
-
-    # Get the latest data point and convert from HGAL to gallons
-    latest = usage_data[-1]
-    value = latest.get("value")
-
-    if value is None:
+    if gallons is None:
         return None
 
     try:
-        # Convert from hundred gallons (HGAL) to gallons
-        return float(value) * 100
+        return float(gallons)
     except (ValueError, TypeError):
         return None
 
 
 def _get_account_balance(data: dict[str, Any]) -> StateType:
     """Extract account balance from account data."""
-    account = data.get("account", {}).get("myAccount", {})
+    account = data.get("my_account", {})
     balance = account.get("accountBalance")
 
     if balance is None:
@@ -73,7 +63,7 @@ def _get_account_balance(data: dict[str, Any]) -> StateType:
 
 def _get_latest_bill(data: dict[str, Any]) -> StateType:
     """Extract latest bill amount from account data."""
-    account = data.get("account", {}).get("myAccount", {})
+    account = data.get("my_account", {})
     bill = account.get("latestBillAmount")
 
     if bill is None:
@@ -87,7 +77,7 @@ def _get_latest_bill(data: dict[str, Any]) -> StateType:
 
 def _get_previous_balance(data: dict[str, Any]) -> StateType:
     """Extract previous balance from account data."""
-    account = data.get("account", {}).get("myAccount", {})
+    account = data.get("my_account", {})
     previous_balance = account.get("previousBalance")
 
     if previous_balance is None:
@@ -101,7 +91,7 @@ def _get_previous_balance(data: dict[str, Any]) -> StateType:
 
 def _get_payments_received(data: dict[str, Any]) -> StateType:
     """Extract payments received from account data."""
-    account = data.get("account", {}).get("myAccount", {})
+    account = data.get("my_account", {})
     # latestPayment is negative (e.g., "-331.7"), so we'll return absolute value
     payments = account.get("latestPayment")
 
@@ -201,6 +191,7 @@ class DelCoWaterSensor(CoordinatorEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
+        self._value_fn = description.value_fn
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
 
         # Group sensors under a service device (like Opower does)
@@ -215,6 +206,6 @@ class DelCoWaterSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> StateType:
         """Return the state of the sensor."""
-        if self.entity_description.value_fn:
-            return self.entity_description.value_fn(self.coordinator.data)
+        if self._value_fn:
+            return self._value_fn(self.coordinator.data)
         return None
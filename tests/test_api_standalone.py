@@ -2,14 +2,21 @@
 import json
 import os
 import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from io import BytesIO
+from pathlib import Path
 
 import pdfplumber
 import requests
+from requests.adapters import HTTPAdapter
 from pycognito import Cognito
 from dotenv import load_dotenv
 
+from token_cache import TOKEN_EXPIRY_MARGIN, load_tokens, save_tokens
+
 # Load environment variables
 load_dotenv()
 
@@ -20,6 +27,150 @@ COGNITO_USER_POOL_ID = "us-east-2_OicSaC5QT"
 COGNITO_CLIENT_ID = "2uh8gm2iusiquj7m2tt55dfpce"
 FREQUENCY_DAILY = "D"
 FREQUENCY_MONTHLY = "M"
+DATE_FORMAT = "%Y-%m-%d"
+PDF_DOWNLOAD_WORKERS = 4
+# (connect, read) timeouts: fail fast if the host is unreachable
+REQUEST_TIMEOUT = (5, 30)
+JSON_HEADERS = {"Content-Type": "application/json"}
+# Set DELCO_VERBOSE=1 to print the raw API responses
+VERBOSE = bool(os.getenv("DELCO_VERBOSE"))
+# Bill page text is cached here between runs; bills never change once issued
+BILL_CACHE_DIR = Path(os.getenv("DELCO_CACHE_DIR", Path.home() / ".cache" / "delco"))
+# Tokens are reused across runs until shortly before they expire
+TOKEN_CACHE_PATH = BILL_CACHE_DIR / "token.json"
+
+# Bill PDF formats (see parse_bill_pdf). No re.DOTALL, matching the
+# integration: ".*?" must not run past the end of the charge line
+# FORMAT 1 (NEW) and FORMAT 2 (MID) both start at the "Water ..." charge line,
+# so they share one alternation and a single scan; the named group that
+# participated tells them apart
+# FORMAT 1 - NEW: Usage in GALLONS, no hyphen between dates
+NEW_CHARGE_LINE = (
+    r"(?P<new>Water Residential Charge\s+.*?"
+    r"(?P<new_from>\d{2}/\d{2}/\d{2})\s+(?P<new_to>\d{2}/\d{2}/\d{2})\s+"
+    r"(?P<new_prior>\d+)\s+(?P<new_current>\d+)\s+(?P<new_usage>\d+)\s+"
+    r"\$?(?P<new_charges>[\d.]+))"
+)
+# FORMAT 2 - MID: Usage in HGAL, hyphen between dates
+MID_CHARGE_LINE = (
+    r"(?P<mid>Water (?:Residential Charge|Charges[^\d]*)\s+.*?"
+    r"(?P<mid_from>\d{2}/\d{2}/\d{2})\s*-\s*(?P<mid_to>\d{2}/\d{2}/\d{2})\s+"
+    r"(?P<mid_prior>[\d,]+)\s+(?P<mid_current>[\d,]+)\s+(?P<mid_usage>\d+)\s+"
+    r"\$?(?P<mid_charges>[\d.]+))"
+)
+CHARGE_LINE_PATTERN = re.compile(f"{NEW_CHARGE_LINE}|{MID_CHARGE_LINE}")
+# FORMAT 1 takes priority wherever it appears, so a FORMAT 2 match is
+# re-checked for a later FORMAT 1 line
+NEW_CHARGE_LINE_PATTERN = re.compile(NEW_CHARGE_LINE)
+
+# FORMAT 3 - OLD: Two-line format with meter ID
+OLD_READING_PATTERN = re.compile(
+    r"(\d+)\s+(\d{2}/\d{2}/\d{2})\s*-\s*(\d{2}/\d{2}/\d{2})\s+"
+    r"Actual\s+([\d,]+)\s+([\d,]+)\s+(\d+)"
+)
+OLD_CHARGE_PATTERN = re.compile(
+    r"Water Residential Service\s+\d+\s+"
+    r"TOTAL USAGE ALL METERS\s+(\d+)\s+[\d.]+\s+\$?([\d.]+)"
+)
+
+
+def default_date_range(start_date, end_date, days=365):
+    """Fill in missing dates with a range of `days` ending today."""
+    if start_date and end_date:
+        return start_date, end_date
+
+    today = datetime.now()
+    return (
+        start_date or (today - timedelta(days=days)).strftime(DATE_FORMAT),
+        end_date or today.strftime(DATE_FORMAT),
+    )
+
+
+def extract_bill_text(pdf_content):
+    """Extract the text of a bill PDF's first page."""
+    # Everything we need is on the first page; don't load the others
+    with pdfplumber.open(BytesIO(pdf_content), pages=[1]) as pdf:
+        if not pdf.pages:
+            return None
+        return pdf.pages[0].extract_text() or None
+
+
+def parse_bill_pdf(pdf_content):
+    """Parse bill PDF to extract usage data."""
+    text = extract_bill_text(pdf_content)
+    return parse_bill_text(text) if text else None
+
+
+def parse_bill_text(text):
+    """Parse a bill's first-page text to extract usage data."""
+    match = CHARGE_LINE_PATTERN.search(text)
+    if match and match["mid"] and (
+        new_match := NEW_CHARGE_LINE_PATTERN.search(text, match.start())
+    ):
+        match = new_match
+
+    # FORMAT 1 - NEW: Usage in GALLONS, no hyphen between dates
+    if match and match["new"]:
+        return {
+            "service_from": match["new_from"],
+            "service_to": match["new_to"],
+            "prior_reading": int(match["new_prior"]),
+            "current_reading": int(match["new_current"]),
+            "usage_gallons": int(match["new_usage"]),
+            "charges": float(match["new_charges"]),
+            "format": "new_gallons",
+        }
+
+    # FORMAT 2 - MID: Usage in HGAL, hyphen between dates
+    if match:
+        return {
+            "service_from": match["mid_from"],
+            "service_to": match["mid_to"],
+            "prior_reading": int(match["mid_prior"].replace(",", "")),
+            "current_reading": int(match["mid_current"].replace(",", "")),
+            "usage_gallons": int(match["mid_usage"]) * 100,
+            "charges": float(match["mid_charges"]),
+            "format": "mid_hgal",
+        }
+
+    # FORMAT 3 - OLD: Two-line format with meter ID
+    reading_match = OLD_READING_PATTERN.search(text)
+    charge_match = OLD_CHARGE_PATTERN.search(text)
+
+    if reading_match and charge_match:
+        return {
+            "service_from": reading_match.group(2),
+            "service_to": reading_match.group(3),
+            "prior_reading": int(reading_match.group(4).replace(",", "")),
+            "current_reading": int(reading_match.group(5).replace(",", "")),
+            "usage_gallons": int(reading_match.group(6)) * 100,
+            "charges": float(charge_match.group(2)),
+            "format": "old_hgal",
+        }
+
+    return None
+
+
+def bill_text_path(bill):
+    """Get the disk cache path for a bill's first-page text."""
+    return BILL_CACHE_DIR / f"{bill['billId']}_{bill['billDate']}.txt"
+
+
+def load_cached_bill_text(bill):
+    """Load a bill's text from the disk cache, if present."""
+    try:
+        return bill_text_path(bill).read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def save_cached_bill_text(bill, text):
+    """Store a bill's text in the disk cache."""
+    # Bill text holds the name, address and account number: keep it private
+    BILL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    fd = os.open(bill_text_path(bill), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as text_file:
+        text_file.write(text)
 
 
 class DelCoWaterAPI:
@@ -33,9 +184,27 @@ class DelCoWaterAPI:
         self.id_token = None
         self._cognito = None
         self._account_data = None
+        self._token_body = None
+        self._account_lock = threading.Lock()
+        self._bill_base_url = None
+
+        # One keep-alive session for the API and bill PDF hosts
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=PDF_DOWNLOAD_WORKERS),
+        )
+
+    def close(self):
+        """Close the HTTP session."""
+        self._session.close()
 
     def authenticate(self) -> None:
-        """Authenticate with AWS Cognito."""
+        """Authenticate with AWS Cognito, reusing cached tokens if possible."""
+        if self._restore_cached_tokens():
+            print(f"✓ Reusing cached authentication")
+            return
+
         # Initialize Cognito client
         self._cognito = Cognito(
             user_pool_id=COGNITO_USER_POOL_ID,
@@ -46,41 +215,73 @@ class DelCoWaterAPI:
 
         # Authenticate
         self._cognito.authenticate(password=self.password)
+        self._use_tokens()
+
+        print(f"✓ Authentication successful")
+
+    def _restore_cached_tokens(self):
+        """Use the tokens from the last run, renewing them if they expired.
+
+        Renewal is a single refresh-token request instead of the full SRP
+        login. Returns False if there is nothing usable cached.
+        """
+        if (cached := load_tokens(TOKEN_CACHE_PATH, self.username)) is None:
+            return False
+        tokens, expires_at = cached
+
+        self._cognito = Cognito(
+            user_pool_id=COGNITO_USER_POOL_ID,
+            client_id=COGNITO_CLIENT_ID,
+            user_pool_region=COGNITO_REGION,
+            username=self.username,
+            **tokens,
+        )
+        if time.time() >= expires_at - TOKEN_EXPIRY_MARGIN:
+            try:
+                self._cognito.renew_access_token()
+            except Exception:
+                return False
+
+        self._use_tokens()
+        return True
 
-        # Get tokens
+    def _use_tokens(self):
+        """Adopt the Cognito client's tokens and cache them for the next run."""
         self.access_token = self._cognito.access_token
         self.id_token = self._cognito.id_token
 
-        print(f"✓ Authentication successful")
+        # Sent with every API request; json= bodies set Content-Type
+        self._session.headers["Authorization"] = f"Bearer {self.access_token}"
+        # Body of the token-only requests (/account, /auth/ic), serialized once
+        self._token_body = json.dumps({"AccessToken": self.access_token}).encode()
 
-    def _get_headers(self):
-        """Get headers for API requests."""
-        if not self.access_token:
-            raise ValueError("Not authenticated")
-
-        return {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
+        save_tokens(TOKEN_CACHE_PATH, self.username, self._cognito)
 
     def get_account(self):
         """Get account information."""
-        response = requests.post(
+        response = self._session.post(
             f"{API_BASE_URL}/account",
-            headers=self._get_headers(),
-            json={"AccessToken": self.access_token},
-            timeout=30,
+            data=self._token_body,
+            headers=JSON_HEADERS,
+            timeout=REQUEST_TIMEOUT,
         )
         response.raise_for_status()
         data = response.json()
         self._account_data = data
         return data
 
+    def _ensure_account(self):
+        """Fetch account data once, even when called from several threads."""
+        if self._account_data:
+            return
+        with self._account_lock:
+            if not self._account_data:
+                self.get_account()
+
     def get_usage(self, frequency=FREQUENCY_DAILY, start_date=None, end_date=None):
         """Get water usage data."""
         # Get account data first if not cached
-        if not self._account_data:
-            self.get_account()
+        self._ensure_account()
 
         # Extract required fields from account data
         account_info = self._account_data.get("myAccount", {})
@@ -93,10 +294,7 @@ class DelCoWaterAPI:
         account_id = account_info.get("accountId")
 
         # Default date range: 1 year
-        if not end_date:
-            end_date = datetime.now().strftime("%Y-%m-%d")
-        if not start_date:
-            start_date = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
+        start_date, end_date = default_date_range(start_date, end_date)
 
         payload = {
             "AccessToken": self.access_token,
@@ -110,38 +308,33 @@ class DelCoWaterAPI:
             "email": self.username,
         }
 
-        response = requests.post(
+        response = self._session.post(
             f"{API_BASE_URL}/usage",
-            headers=self._get_headers(),
             json=payload,
-            timeout=30,
+            timeout=REQUEST_TIMEOUT,
         )
         response.raise_for_status()
         return response.json()
 
     def get_ic(self):
         """Get IC (Installation/Connection) authentication data."""
-        response = requests.post(
+        response = self._session.post(
             f"{API_BASE_URL}/auth/ic",
-            headers=self._get_headers(),
-            json={"AccessToken": self.access_token},
-            timeout=30,
+            data=self._token_body,
+            headers=JSON_HEADERS,
+            timeout=REQUEST_TIMEOUT,
         )
         response.raise_for_status()
         return response.json()
 
     def get_billing_history(self, start_date=None, end_date=None):
         """Get billing history data."""
-        if not self._account_data:
-            self.get_account()
+        self._ensure_account()
 
         account_info = self._account_data.get("myAccount", {})
         account_id = account_info.get("accountId")
 
-        if not end_date:
-            end_date = datetime.now().strftime("%Y-%m-%d")
-        if not start_date:
-            start_date = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
+        start_date, end_date = default_date_range(start_date, end_date)
 
         payload = {
             "AccessToken": self.access_token,
@@ -152,27 +345,25 @@ class DelCoWaterAPI:
             "email": self.username,
         }
 
-        response = requests.post(
+        response = self._session.post(
             f"{API_BASE_URL}/history/billing",
-            headers=self._get_headers(),
             json=payload,
-            timeout=30,
+            timeout=REQUEST_TIMEOUT,
         )
         response.raise_for_status()
         return response.json()
 
     def _get_bill_pdf_base_url(self):
-        """Get the base URL for bill PDFs."""
-        if not self._account_data:
-            self.get_account()
-
-        bill_url = self._account_data.get("myAccount", {}).get("billDisplayURL", "")
-        return bill_url.rsplit("/", 1)[0]
+        """Get the base URL for bill PDFs (fixed for the account)."""
+        if self._bill_base_url is None:
+            self._ensure_account()
+            bill_url = self._account_data.get("myAccount", {}).get("billDisplayURL", "")
+            self._bill_base_url = bill_url.rsplit("/", 1)[0]
+        return self._bill_base_url
 
     def get_bill_pdf(self, bill_id, bill_date):
         """Download a bill PDF."""
-        if not self._account_data:
-            self.get_account()
+        self._ensure_account()
 
         base_url = self._get_bill_pdf_base_url()
         account_id = self._account_data.get("myAccount", {}).get("accountId")
@@ -180,114 +371,100 @@ class DelCoWaterAPI:
 
         pdf_url = f"{base_url}/{account_id}_{bill_id}_{bill_date_formatted}.pdf"
 
-        response = requests.get(pdf_url, timeout=30)
+        # The PDF host is not the API; don't send it the access token
+        response = self._session.get(
+            pdf_url, headers={"Authorization": None}, timeout=REQUEST_TIMEOUT
+        )
         if response.status_code == 200:
             return response.content
         return None
 
     def parse_bill_pdf(self, pdf_content):
         """Parse bill PDF to extract usage data."""
-        with pdfplumber.open(BytesIO(pdf_content)) as pdf:
-            if not pdf.pages:
-                return None
-
-            text = pdf.pages[0].extract_text()
-            if not text:
-                return None
-
-            # FORMAT 1 - NEW: Usage in GALLONS, no hyphen between dates
-            new_pattern = (
-                r"Water Residential Charge\s+.*?"
-                r"(\d{2}/\d{2}/\d{2})\s+(\d{2}/\d{2}/\d{2})\s+"
-                r"(\d+)\s+(\d+)\s+(\d+)\s+\$?([\d.]+)"
-            )
-            match = re.search(new_pattern, text)
-            if match:
-                return {
-                    "service_from": match.group(1),
-                    "service_to": match.group(2),
-                    "prior_reading": int(match.group(3)),
-                    "current_reading": int(match.group(4)),
-                    "usage_gallons": int(match.group(5)),
-                    "charges": float(match.group(6)),
-                    "format": "new_gallons",
-                }
-
-            # FORMAT 2 - MID: Usage in HGAL, hyphen between dates
-            mid_pattern = (
-                r"Water (?:Residential Charge|Charges[^\d]*)\s+.*?"
-                r"(\d{2}/\d{2}/\d{2})\s*-\s*(\d{2}/\d{2}/\d{2})\s+"
-                r"([\d,]+)\s+([\d,]+)\s+(\d+)\s+\$?([\d.]+)"
-            )
-            match = re.search(mid_pattern, text)
-            if match:
-                return {
-                    "service_from": match.group(1),
-                    "service_to": match.group(2),
-                    "prior_reading": int(match.group(3).replace(",", "")),
-                    "current_reading": int(match.group(4).replace(",", "")),
-                    "usage_gallons": int(match.group(5)) * 100,
-                    "charges": float(match.group(6)),
-                    "format": "mid_hgal",
-                }
-
-            # FORMAT 3 - OLD: Two-line format with meter ID
-            old_reading_pattern = (
-                r"(\d+)\s+(\d{2}/\d{2}/\d{2})\s*-\s*(\d{2}/\d{2}/\d{2})\s+"
-                r"Actual\s+([\d,]+)\s+([\d,]+)\s+(\d+)"
-            )
-            old_charge_pattern = (
-                r"Water Residential Service\s+\d+\s+"
-                r"TOTAL USAGE ALL METERS\s+(\d+)\s+[\d.]+\s+\$?([\d.]+)"
-            )
-
-            reading_match = re.search(old_reading_pattern, text)
-            charge_match = re.search(old_charge_pattern, text)
-
-            if reading_match and charge_match:
-                return {
-                    "service_from": reading_match.group(2),
-                    "service_to": reading_match.group(3),
-                    "prior_reading": int(reading_match.group(4).replace(",", "")),
-                    "current_reading": int(reading_match.group(5).replace(",", "")),
-                    "usage_gallons": int(reading_match.group(6)) * 100,
-                    "charges": float(charge_match.group(2)),
-                    "format": "old_hgal",
-                }
-
-            return None
+        return parse_bill_pdf(pdf_content)
 
     def get_billing_with_usage(self, start_date=None, end_date=None):
         """Get billing history enriched with per-period usage from PDFs."""
         billing_data = self.get_billing_history(start_date, end_date)
-        results = []
-
-        for bill in billing_data.get("billing", []):
-            bill_id = bill.get("billId")
-            bill_date = bill.get("billDate")
-
-            if not bill_id or not bill_date:
-                continue
-
-            pdf_content = self.get_bill_pdf(bill_id, bill_date)
-            if not pdf_content:
-                continue
+        bills = [
+            bill
+            for bill in billing_data.get("billing", [])
+            if bill.get("billId") and bill.get("billDate")
+        ]
+
+        # Bills whose page text is cached on disk are parsed straight from it;
+        # only the rest are downloaded
+        parsed_bills = {}
+        to_fetch = []
+        for bill in bills:
+            text = load_cached_bill_text(bill)
+            if text is None:
+                to_fetch.append(bill)
+            elif parsed := parse_bill_text(text):
+                parsed_bills[bill["billId"]] = parsed
+
+        # Download the PDFs concurrently (account data is already cached by
+        # get_billing_history, so the workers only issue the GETs) and hand
+        # each one to a text extraction process as soon as it arrives.
+        # pdfplumber is pure Python and CPU-bound, so it runs in processes,
+        # not threads
+        with ThreadPoolExecutor(
+            max_workers=PDF_DOWNLOAD_WORKERS
+        ) as downloads, ProcessPoolExecutor() as extractions:
+            download_futures = {
+                downloads.submit(
+                    self.get_bill_pdf, bill["billId"], bill["billDate"]
+                ): bill
+                for bill in to_fetch
+            }
+            extract_futures = {}
+            for future in as_completed(download_futures):
+                pdf_content = future.result()
+                if pdf_content:
+                    extract_futures[
+                        extractions.submit(extract_bill_text, pdf_content)
+                    ] = download_futures[future]
+
+            for future, bill in extract_futures.items():
+                text = future.result()
+                if not text:
+                    continue
+                # Cache the text even if it doesn't parse yet, so a parser
+                # fix doesn't need the PDFs again
+                save_cached_bill_text(bill, text)
+                if parsed := parse_bill_text(text):
+                    parsed_bills[bill["billId"]] = parsed
 
-            parsed = self.parse_bill_pdf(pdf_content)
+        results = []
+        for bill in bills:
+            parsed = parsed_bills.get(bill["billId"])
             if not parsed:
                 continue
 
             results.append({
-                "bill_id": bill_id,
-                "bill_date": bill_date,
+                "bill_id": bill["billId"],
+                "bill_date": bill["billDate"],
                 "read_date": bill.get("readDate"),
                 **parsed,
             })
 
-        results.sort(key=lambda x: datetime.strptime(x["service_to"], "%m/%d/%y"))
+        # MM/DD/YY reordered as YYMMDD sorts chronologically without parsing
+        results.sort(
+            key=lambda x: (
+                x["service_to"][6:8],
+                x["service_to"][0:2],
+                x["service_to"][3:5],
+            )
+        )
         return results
 
 
+def print_raw(data):
+    """Print a raw API response when running verbose."""
+    if VERBOSE:
+        print(f"\n{json.dumps(data, indent=2)}")
+
+
 def test_authentication():
     """Test authentication with Cognito."""
     print("Testing authentication...")
@@ -313,7 +490,7 @@ def test_account(api):
     account_data = api.get_account()
 
     print(f"✓ Account data retrieved")
-    print(f"\n{json.dumps(account_data, indent=2)}")
+    print_raw(account_data)
 
     # Extract key information
     my_account = account_data.get("myAccount", {})
@@ -339,7 +516,7 @@ def test_ic(api):
     ic_data = api.get_ic()
 
     print(f"✓ IC data retrieved")
-    print(f"\n{json.dumps(ic_data, indent=2)}")
+    print_raw(ic_data)
 
 
 def test_usage_monthly(api):
@@ -348,7 +525,7 @@ def test_usage_monthly(api):
     usage_data = api.get_usage(frequency=FREQUENCY_MONTHLY)
 
     print(f"✓ Monthly usage data retrieved")
-    print(f"\n{json.dumps(usage_data, indent=2)}")
+    print_raw(usage_data)
 
     # Extract usage information
     usage = usage_data.get("usage", {})
@@ -372,7 +549,7 @@ def test_usage_daily(api):
     usage_data = api.get_usage(frequency=FREQUENCY_DAILY)
 
     print(f"✓ Daily usage data retrieved")
-    print(f"\n{json.dumps(usage_data, indent=2)}")
+    print_raw(usage_data)
 
     # Extract usage information
     usage = usage_data.get("usage", {})
@@ -481,6 +658,8 @@ def main():
         print(f"\n❌ Error during testing: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        api.close()
 
 
 if __name__ == "__main__":
@@ -1,12 +1,18 @@
 """Test different frequency options for usage data."""
+import argparse
 import json
 import os
-from datetime import datetime, timedelta
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
 
-import requests
-from pycognito import Cognito
 from dotenv import load_dotenv
 
+from token_cache import TOKEN_EXPIRY_MARGIN, load_tokens, save_tokens
+
 # Load environment variables
 load_dotenv()
 
@@ -15,6 +21,60 @@ API_BASE_URL = "https://delco-api.cloud-esc.com/v2"
 COGNITO_REGION = "us-east-2"
 COGNITO_USER_POOL_ID = "us-east-2_OicSaC5QT"
 COGNITO_CLIENT_ID = "2uh8gm2iusiquj7m2tt55dfpce"
+CACHE_DIR = Path(os.getenv("DELCO_CACHE_DIR", Path.home() / ".cache" / "delco"))
+# Tokens are reused across runs (shared with test_api_standalone.py) until
+# shortly before they expire
+TOKEN_CACHE_PATH = CACHE_DIR / "token.json"
+# Per-frequency results of past probes; the supported set is a server-side
+# enum, so frequencies found unavailable are skipped for a week (or --full)
+FREQUENCY_CACHE_PATH = CACHE_DIR / "freq_support.json"
+FREQUENCY_CACHE_TTL = 7 * 24 * 3600
+# Probes sent at once (one pooled connection each)
+MAX_PARALLEL_PROBES = 11
+
+# Frequency options to probe: (code, name, label for the summary)
+FREQUENCIES = [
+    (code, name, f"{code} ({name})")
+    for code, name in (
+        ("D", "Daily"),
+        ("W", "Weekly"),
+        ("M", "Monthly"),
+        ("Q", "Quarterly"),
+        ("Y", "Yearly"),
+        ("H", "Hourly"),
+        ("15", "15-minute intervals"),
+        ("30", "30-minute intervals"),
+        ("60", "60-minute intervals"),
+        ("B", "Biweekly"),
+        ("S", "Semi-monthly"),
+    )
+]
+
+
+def load_frequency_results():
+    """Load past probe results: code -> {"ok": bool, "checked_at": seconds}.
+
+    Malformed entries (e.g. a hand-edited or truncated file) are dropped.
+    """
+    try:
+        cached = json.loads(FREQUENCY_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cached, dict):
+        return {}
+    return {
+        code: result
+        for code, result in cached.items()
+        if isinstance(result, dict)
+        and isinstance(result.get("ok"), bool)
+        and isinstance(result.get("checked_at"), (int, float))
+    }
+
+
+def save_frequency_results(cached):
+    """Store probe results for the next run."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    FREQUENCY_CACHE_PATH.write_text(json.dumps(cached))
 
 
 class DelCoWaterAPI:
@@ -28,9 +88,34 @@ class DelCoWaterAPI:
         self.id_token = None
         self._cognito = None
         self._account_data = None
+        self._account_lock = threading.Lock()
+        self._headers = None
+        # Default (start, end) dates: the year up to today, computed once
+        self._default_dates = None
+
+        # requests and pycognito are slow to import; defer them until a client
+        # is actually built so --help and config errors return immediately
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        # One keep-alive session shared by every request
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=MAX_PARALLEL_PROBES),
+        )
+
+    def close(self):
+        """Close the HTTP session."""
+        self._session.close()
 
     def authenticate(self) -> None:
-        """Authenticate with AWS Cognito."""
+        """Authenticate with AWS Cognito, reusing cached tokens if possible."""
+        if self._restore_cached_tokens():
+            return
+
+        from pycognito import Cognito
+
         self._cognito = Cognito(
             user_pool_id=COGNITO_USER_POOL_ID,
             client_id=COGNITO_CLIENT_ID,
@@ -38,19 +123,54 @@ class DelCoWaterAPI:
             username=self.username,
         )
         self._cognito.authenticate(password=self.password)
+        self._use_tokens()
+
+    def _restore_cached_tokens(self):
+        """Use the tokens from the last run, renewing them if they expired.
+
+        Renewal is a single refresh-token request instead of the full SRP
+        login. Returns False if there is nothing usable cached.
+        """
+        if (cached := load_tokens(TOKEN_CACHE_PATH, self.username)) is None:
+            return False
+        tokens, expires_at = cached
+
+        from pycognito import Cognito
+
+        self._cognito = Cognito(
+            user_pool_id=COGNITO_USER_POOL_ID,
+            client_id=COGNITO_CLIENT_ID,
+            user_pool_region=COGNITO_REGION,
+            username=self.username,
+            **tokens,
+        )
+        if time.time() >= expires_at - TOKEN_EXPIRY_MARGIN:
+            try:
+                self._cognito.renew_access_token()
+            except Exception:
+                return False
+
+        self._use_tokens()
+        return True
+
+    def _use_tokens(self):
+        """Adopt the Cognito client's tokens and cache them for the next run."""
         self.access_token = self._cognito.access_token
         self.id_token = self._cognito.id_token
-
-    def _get_headers(self):
-        """Get headers for API requests."""
-        return {
+        self._headers = {
             "Authorization": f"Bearer {self.access_token}",
             "Content-Type": "application/json",
         }
 
+        save_tokens(TOKEN_CACHE_PATH, self.username, self._cognito)
+
+    def _get_headers(self):
+        """Get headers for API requests (built when the tokens change)."""
+        return self._headers
+
     def get_account(self):
         """Get account information."""
-        response = requests.post(
+        response = self._session.post(
             f"{API_BASE_URL}/account",
             headers=self._get_headers(),
             json={"AccessToken": self.access_token},
@@ -61,20 +181,32 @@ class DelCoWaterAPI:
         self._account_data = data
         return data
 
+    def _ensure_account(self):
+        """Fetch account data once, even when probes ask for it concurrently."""
+        if self._account_data:
+            return
+        with self._account_lock:
+            if not self._account_data:
+                self.get_account()
+
     def get_usage(self, frequency, start_date=None, end_date=None):
         """Get water usage data."""
-        if not self._account_data:
-            self.get_account()
+        self._ensure_account()
 
         account_info = self._account_data.get("myAccount", {})
         service_addresses = account_info.get("serviceAddresses", [])
         premise_id = service_addresses[0].get("premiseId")
         account_id = account_info.get("accountId")
 
-        if not end_date:
-            end_date = datetime.now().strftime("%Y-%m-%d")
-        if not start_date:
-            start_date = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
+        if not start_date or not end_date:
+            if self._default_dates is None:
+                today = date.today()
+                self._default_dates = (
+                    (today - timedelta(days=365)).isoformat(),
+                    today.isoformat(),
+                )
+            start_date = start_date or self._default_dates[0]
+            end_date = end_date or self._default_dates[1]
 
         payload = {
             "AccessToken": self.access_token,
@@ -88,7 +220,7 @@ class DelCoWaterAPI:
             "email": self.username,
         }
 
-        response = requests.post(
+        response = self._session.post(
             f"{API_BASE_URL}/usage",
             headers=self._get_headers(),
             json=payload,
@@ -98,14 +230,25 @@ class DelCoWaterAPI:
         return response.json()
 
 
-def test_frequency(api, frequency_code, frequency_name):
-    """Test a specific frequency option."""
-    print(f"\n{'='*60}")
-    print(f"Testing: {frequency_name} (code: '{frequency_code}')")
-    print(f"{'='*60}")
+def fetch_usage(api, frequency_code):
+    """Fetch usage for one frequency, returning the exception if it fails."""
+    try:
+        return api.get_usage(frequency=frequency_code)
+    except Exception as e:
+        return e
+
+
+def test_frequency(frequency_code, frequency_name, usage_data):
+    """Report the usage response (or error) for a specific frequency option."""
+    # Collected and written in one go, so each probe's report is one write
+    out = []
+    out.append(f"\n{'='*60}")
+    out.append(f"Testing: {frequency_name} (code: '{frequency_code}')")
+    out.append(f"{'='*60}")
 
     try:
-        usage_data = api.get_usage(frequency=frequency_code)
+        if isinstance(usage_data, Exception):
+            raise usage_data
 
         # Check if we got data
         usage = usage_data.get("usage", {})
@@ -113,40 +256,51 @@ def test_frequency(api, frequency_code, frequency_name):
         message = usage.get("message", "")
         usage_history = usage.get("usageHistory", [])
 
-        print(f"Status: {status}")
+        out.append(f"Status: {status}")
         if message:
-            print(f"Message: {message}")
+            out.append(f"Message: {message}")
 
         if usage_history and len(usage_history) > 0:
             history = usage_history[0]
             usage_data_points = history.get("usageData", [])
 
             if usage_data_points:
-                print(f"✅ SUCCESS - Got {len(usage_data_points)} data points")
-                print(f"\nSample data (first 5):")
+                out.append(f"✅ SUCCESS - Got {len(usage_data_points)} data points")
+                out.append(f"\nSample data (first 5):")
                 for point in usage_data_points[:5]:
-                    print(f"  {point.get('period')}: {point.get('value')} {history.get('uom')}")
+                    out.append(f"  {point.get('period')}: {point.get('value')} {history.get('uom')}")
 
                 if len(usage_data_points) > 5:
-                    print(f"\nSample data (last 5):")
+                    out.append(f"\nSample data (last 5):")
                     for point in usage_data_points[-5:]:
-                        print(f"  {point.get('period')}: {point.get('value')} {history.get('uom')}")
+                        out.append(f"  {point.get('period')}: {point.get('value')} {history.get('uom')}")
 
                 return True
             else:
-                print(f"❌ EMPTY - No usage data points returned")
+                out.append(f"❌ EMPTY - No usage data points returned")
                 return False
         else:
-            print(f"❌ EMPTY - No usage history returned")
+            out.append(f"❌ EMPTY - No usage history returned")
             return False
 
     except Exception as e:
-        print(f"❌ ERROR - {e}")
+        out.append(f"❌ ERROR - {e}")
         return False
 
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
+
 
 def main():
     """Test various frequency options."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="also re-probe frequencies found unavailable in the last week",
+    )
+    args = parser.parse_args()
+
     print("="*60)
     print("Del-Co Water API - Frequency Options Test")
     print("="*60)
@@ -164,33 +318,50 @@ def main():
     api.authenticate()
     print("✓ Authenticated")
 
-    # Test various frequency options
-    frequencies = [
-        ("D", "Daily"),
-        ("W", "Weekly"),
-        ("M", "Monthly"),
-        ("Q", "Quarterly"),
-        ("Y", "Yearly"),
-        ("H", "Hourly"),
-        ("15", "15-minute intervals"),
-        ("30", "30-minute intervals"),
-        ("60", "60-minute intervals"),
-        ("B", "Biweekly"),
-        ("S", "Semi-monthly"),
-    ]
+    # Frequencies recently found unavailable are not probed again
+    cached = load_frequency_results()
+    now = time.time()
+    skipped = set()
+    if not args.full:
+        skipped = {
+            code
+            for code, result in cached.items()
+            if not result["ok"] and now - result["checked_at"] < FREQUENCY_CACHE_TTL
+        }
+    to_probe = [freq for freq in FREQUENCIES if freq[0] not in skipped]
 
-    results = {}
+    # The probes are independent, so send them all at once
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_PARALLEL_PROBES) as pool:
+            responses = list(
+                pool.map(lambda freq: fetch_usage(api, freq[0]), to_probe)
+            )
+    finally:
+        api.close()
+
+    # Report in the original order
+    results = {code: False for code in skipped}
 
-    for code, name in frequencies:
-        results[code] = test_frequency(api, code, name)
+    for (code, name, _), usage_data in zip(to_probe, responses):
+        results[code] = test_frequency(code, name, usage_data)
+        # Request errors may be transient, so only answers are remembered
+        if not isinstance(usage_data, Exception):
+            cached[code] = {"ok": results[code], "checked_at": now}
+
+    save_frequency_results(cached)
 
     # Summary
     print(f"\n{'='*60}")
     print("SUMMARY")
     print(f"{'='*60}")
 
-    working = [f"{code} ({name})" for (code, name), success in zip(frequencies, results.values()) if success]
-    not_working = [f"{code} ({name})" for (code, name), success in zip(frequencies, results.values()) if not success]
+    working = []
+    not_working = []
+    for code, _, label in FREQUENCIES:
+        if code in skipped:
+            not_working.append(f"{label} (cached, use --full to re-probe)")
+        else:
+            (working if results[code] else not_working).append(label)
 
     if working:
         print("\n✅ Working frequencies:")
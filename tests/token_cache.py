@@ -0,0 +1,47 @@
+"""Cognito token cache shared by the standalone API scripts."""
+import base64
+import json
+import os
+
+# Renew the access token this many seconds before it actually expires
+TOKEN_EXPIRY_MARGIN = 60
+
+TOKEN_FIELDS = ("id_token", "access_token", "refresh_token")
+
+
+def token_expiry(token):
+    """Return the expiry (exp claim, seconds since epoch) of a JWT."""
+    payload = token.split(".")[1]
+    payload += "=" * (-len(payload) % 4)
+    return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+
+
+def load_tokens(path, username):
+    """Return the tokens cached for username and the access token's expiry.
+
+    Returns None if nothing usable is cached. A partial or corrupt file
+    counts as a miss, so the caller falls back to a full login.
+    """
+    try:
+        cached = json.loads(path.read_text())
+        if cached.get("username") != username:
+            return None
+        tokens = {key: cached[key] for key in TOKEN_FIELDS}
+        return tokens, token_expiry(tokens["access_token"])
+    except (OSError, ValueError, KeyError, IndexError, TypeError, AttributeError):
+        return None
+
+
+def save_tokens(path, username, cognito):
+    """Store a Cognito client's tokens for the next run."""
+    # Tokens are credentials: keep the file private to the user
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as token_file:
+        json.dump(
+            {
+                "username": username,
+                **{key: getattr(cognito, key) for key in TOKEN_FIELDS},
+            },
+            token_file,
+        )
@@ -6,22 +6,119 @@ Use this script to manually insert historical usage/cost data that
 couldn't be retrieved from PDFs (e.g., old bills not available).
 
 Usage:
-    python insert_manual_statistics.py
+    python insert_manual_statistics.py [DB_PATH]
 
 The script will prompt you for the data and generate SQL statements
-that you can run against your Home Assistant database.
+that you can run against your Home Assistant database. If DB_PATH is
+given (stop Home Assistant first), the rows are inserted directly.
 """
 
+import argparse
 import sqlite3
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
 
 def parse_date(date_str: str) -> datetime:
-    """Parse date in MM/DD/YY format."""
-    return datetime.strptime(date_str, "%m/%d/%y").replace(
-        hour=12, minute=0, second=0, tzinfo=timezone.utc
-    )
+    """Parse date in MM/DD/YY or YYYY-MM-DD format."""
+    # ISO dates take fromisoformat's C fast path and skip loading _strptime
+    if "-" in date_str:
+        date = datetime.fromisoformat(date_str)
+    else:
+        date = datetime.strptime(date_str, "%m/%d/%y")
+    return date.replace(hour=12, minute=0, second=0, tzinfo=timezone.utc)
+
+
+INSERT_STATISTIC_SQL = (
+    "INSERT INTO statistics (created_ts, start_ts, metadata_id, state, sum) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+
+
+def insert_statistics(
+    db_path: str,
+    entries: list[dict],
+    consumption_statistic_id: str,
+    cost_statistic_id: str,
+) -> None:
+    """Insert the entries directly into a Home Assistant database."""
+    # Open read-write without create, so a mistyped path isn't turned into
+    # a new empty database
+    try:
+        conn = sqlite3.connect(
+            f"{Path(db_path).resolve().as_uri()}?mode=rw", uri=True
+        )
+    except sqlite3.OperationalError:
+        print(f"Database not found: {db_path}")
+        return
+
+    try:
+        try:
+            meta_ids = dict(
+                conn.execute(
+                    "SELECT statistic_id, id FROM statistics_meta WHERE statistic_id IN (?, ?)",
+                    (consumption_statistic_id, cost_statistic_id),
+                )
+            )
+        except sqlite3.DatabaseError as err:
+            print(f"{db_path} is not a Home Assistant database: {err}")
+            return
+        missing = {consumption_statistic_id, cost_statistic_id} - meta_ids.keys()
+        if missing:
+            print(f"Statistics not found in database: {', '.join(sorted(missing))}")
+            return
+
+        def last_sum(metadata_id: int) -> float:
+            row = conn.execute(
+                "SELECT sum FROM statistics WHERE metadata_id = ? "
+                "ORDER BY start_ts DESC LIMIT 1",
+                (metadata_id,),
+            ).fetchone()
+            return row[0] if row and row[0] is not None else 0.0
+
+        consumption_id = meta_ids[consumption_statistic_id]
+        cost_id = meta_ids[cost_statistic_id]
+        consumption_sum = last_sum(consumption_id)
+        cost_sum = last_sum(cost_id)
+
+        # All rows are created in this one run
+        created_ts = int(datetime.now(timezone.utc).timestamp())
+        consumption_rows = []
+        cost_rows = []
+        for e in entries:
+            timestamp = int(e["date"].timestamp())
+            consumption_sum += e["usage_gallons"]
+            cost_sum += e["cost"]
+            consumption_rows.append((
+                created_ts,
+                timestamp,
+                consumption_id,
+                e["usage_gallons"],
+                consumption_sum,
+            ))
+            cost_rows.append((
+                created_ts,
+                timestamp,
+                cost_id,
+                e["cost"],
+                cost_sum,
+            ))
+
+        # The statement is prepared once and bound for every row
+        try:
+            with conn:
+                conn.executemany(INSERT_STATISTIC_SQL, consumption_rows)
+                conn.executemany(INSERT_STATISTIC_SQL, cost_rows)
+        except sqlite3.IntegrityError as err:
+            print(f"Statistics already exist for one of these dates ({err}).")
+            print("Nothing was inserted.")
+            return
+    finally:
+        conn.close()
+
+    print(f"Inserted {len(entries)} entries into {db_path}")
+    print("Restart Home Assistant to see the changes.")
 
 
 def generate_sql_for_statistics(
@@ -45,7 +142,7 @@ def generate_sql_for_statistics(
 
     while True:
         print("-" * 40)
-        date_str = input("Service TO date (MM/DD/YY) or 'done': ").strip()
+        date_str = input("Service TO date (MM/DD/YY or YYYY-MM-DD) or 'done': ").strip()
 
         if date_str.lower() == 'done':
             break
@@ -53,7 +150,7 @@ def generate_sql_for_statistics(
         try:
             service_date = parse_date(date_str)
         except ValueError:
-            print("Invalid date format. Use MM/DD/YY (e.g., 01/31/25)")
+            print("Invalid date format. Use MM/DD/YY (e.g., 01/31/25) or YYYY-MM-DD")
             continue
 
         try:
@@ -94,6 +191,11 @@ def generate_sql_for_statistics(
     for e in entries:
         print(f"{e['date_str']:<15} {e['usage_gallons']:>12,.0f}   ${e['cost']:>8.2f}")
 
+    if db_path:
+        print()
+        insert_statistics(db_path, entries, consumption_statistic_id, cost_statistic_id)
+        return
+
     print()
     print("=" * 60)
     print("SQL STATEMENTS")
@@ -118,19 +220,26 @@ def generate_sql_for_statistics(
     print("-- sqlite3 /config/home-assistant_v2.db")
     print()
 
+    # Built once, then printed and (optionally) saved, so both always use
+    # the same starting sums
+    created_ts = int(datetime.now(timezone.utc).timestamp())
+    sql_blocks = []
     for e in entries:
         timestamp = int(e["date"].timestamp())
         consumption_sum += e["usage_gallons"]
         cost_sum += e["cost"]
 
-        print(f"-- {e['date_str']}: {e['usage_gallons']:,.0f} gal, ${e['cost']:.2f}")
-        print(f"INSERT INTO statistics (created_ts, start_ts, metadata_id, state, sum)")
-        print(f"VALUES ({int(datetime.now().timestamp())}, {timestamp}, <CONSUMPTION_META_ID>, {e['usage_gallons']}, {consumption_sum});")
-        print()
-        print(f"INSERT INTO statistics (created_ts, start_ts, metadata_id, state, sum)")
-        print(f"VALUES ({int(datetime.now().timestamp())}, {timestamp}, <COST_META_ID>, {e['cost']}, {cost_sum});")
-        print()
-
+        sql_blocks.append(
+            f"-- {e['date_str']}: {e['usage_gallons']:,.0f} gal, ${e['cost']:.2f}\n"
+            f"INSERT INTO statistics (created_ts, start_ts, metadata_id, state, sum)\n"
+            f"VALUES ({created_ts}, {timestamp}, <CONSUMPTION_META_ID>, {e['usage_gallons']}, {consumption_sum});\n\n"
+            f"INSERT INTO statistics (created_ts, start_ts, metadata_id, state, sum)\n"
+            f"VALUES ({created_ts}, {timestamp}, <COST_META_ID>, {e['cost']}, {cost_sum});\n\n"
+        )
+    # One transaction, so the whole batch commits (and syncs) once
+    sql = "BEGIN TRANSACTION;\n\n" + "".join(sql_blocks) + "COMMIT;\n\n"
+
+    sys.stdout.write(sql)
     print("-- After inserting, restart Home Assistant to see the changes.")
 
     # Optionally write to a file
@@ -139,26 +248,17 @@ def generate_sql_for_statistics(
         with open(output_file, "w") as f:
             f.write("-- Del-Co Water Manual Statistics Insertion\n")
             f.write(f"-- Generated: {datetime.now().isoformat()}\n\n")
-
-            consumption_sum_reset = float(input("Re-enter starting consumption sum: ") or "0")
-            cost_sum_reset = float(input("Re-enter starting cost sum: ") or "0")
-
-            consumption_sum = consumption_sum_reset
-            cost_sum = cost_sum_reset
-
-            for e in entries:
-                timestamp = int(e["date"].timestamp())
-                consumption_sum += e["usage_gallons"]
-                cost_sum += e["cost"]
-
-                f.write(f"-- {e['date_str']}: {e['usage_gallons']:,.0f} gal, ${e['cost']:.2f}\n")
-                f.write(f"INSERT INTO statistics (created_ts, start_ts, metadata_id, state, sum)\n")
-                f.write(f"VALUES ({int(datetime.now().timestamp())}, {timestamp}, <CONSUMPTION_META_ID>, {e['usage_gallons']}, {consumption_sum});\n\n")
-                f.write(f"INSERT INTO statistics (created_ts, start_ts, metadata_id, state, sum)\n")
-                f.write(f"VALUES ({int(datetime.now().timestamp())}, {timestamp}, <COST_META_ID>, {e['cost']}, {cost_sum});\n\n")
+            f.write(sql)
 
         print(f"Saved to {output_file}")
 
 
 if __name__ == "__main__":
-    generate_sql_for_statistics()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "db_path",
+        nargs="?",
+        help="Home Assistant database to insert into directly (stop HA first)",
+    )
+    args = parser.parse_args()
+    generate_sql_for_statistics(args.db_path)